@@ -40,14 +40,24 @@ SOFTWARE.
 """
 
 import argparse
+import asyncio
+import concurrent.futures
 import logging
+import random
+import re
 import secrets
+import signal
 import threading
-import time
+from dataclasses import dataclass
 from pathlib import Path
 import requests
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 try:
     import meshtastic.serial_interface
     import meshtastic.tcp_interface
@@ -60,19 +70,61 @@ except ImportError:
 import serial.tools.list_ports
 
 from modules.bbs import BBS
+from modules.send_queue import SendQueue
 from modules.tides import TidesScraper
+from modules.ttl_cache import TTLCache
 from modules.twin_cipher import TwinHexDecoder, TwinHexEncoder
 from modules.whois import Whois
 from modules.wttr import WeatherFetcher
 
+# The twin-hex codecs are stateless; share one instance of each instead
+# of constructing a fresh codec per message
+_TWIN_ENC = TwinHexEncoder()
+_TWIN_DEC = TwinHexDecoder()
+
+# Static reply strings, built once instead of per invocation
+ACK_TEXT = "🟢 ACK"
+COOLDOWN_TEXT = "❌ Bot has reached duty cycle, entering cool down... ❄"
+HELP_TEXT = (
+    "Available commands:\n #help\n #test\n #tst-detail\n #weather\n"
+    " #tides\n #flipcoin\n #random\n"
+)
+
 
 def find_serial_ports():
-    # Use the list_ports module to get a list of available serial ports
-    ports = [port.device for port in serial.tools.list_ports.comports()]
-    filtered_ports = [
-        port for port in ports if "COM" in port.upper() or "USB" in port.upper()
+    # Filter the available serial ports in one pass; match the Linux ACM
+    # devices meshtastic boards enumerate as, not just COM/USB names
+    return [
+        port.device
+        for port in serial.tools.list_ports.comports()
+        if (upper := port.device.upper()).startswith(
+            ("COM", "/DEV/TTYUSB", "/DEV/TTYACM")
+        )
+        or "USB" in upper
     ]
-    return filtered_ports
+
+
+def _addr(node_num):
+    # Meshtastic display form of a node number, e.g. !0da62345
+    return f"!{node_num:08x}"
+
+
+def _hex(node_num):
+    # Unpadded form matching how the bundled DBs store node ids
+    return f"{node_num:x}"
+
+
+@dataclass(slots=True)
+class Tokens:
+    """Inbound message text parsed once and shared across handlers.
+
+    Only the command token is case-folded; parts keep the sender's
+    original casing so payloads (BBS posts, cipher text) survive intact.
+    """
+
+    raw: str
+    cmd: str
+    parts: list
 
 
 # Configure logging
@@ -87,19 +139,54 @@ class MeshBot:
         self.serial_ports = serial_port
         self.ip_host = ip_host
         self.db = db
-        self.weather_info = None
-        self.tides_info = None
+        self.data_cache = TTLCache()
 
         self.transmission_count = 0
         self.cooldown = False
         self.kill_all_robots = 0  # Assuming you missed defining kill_all_robots
 
+        self._hex_re = re.compile(r"^[0-9a-fA-F]+$")
+        self._settings = None
+        self._state_lock = threading.Lock()
+
+        # Coin flips and dice rolls don't need the OS entropy pool; seed a
+        # plain PRNG once from it instead of a syscall per roll
+        self._rng = random.Random(secrets.randbits(64))
+
+        # Handlers run off the pubsub callback thread so a slow whois or
+        # scrape doesn't stall delivery of subsequent inbound packets
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="meshbot-cmd"
+        )
+
         self.load_setting()
 
+        # Dispatch table keyed on the leading "#word" token of a message.
+        # A single dict lookup replaces the old chain of substring scans and
+        # anchors matching to the first token (so e.g. "#help" no longer
+        # matches inside "#helpme").
+        self._commands = {
+            "#fw": lambda t, i, s, p: self.command_fw(t),
+            "#dm": lambda t, i, s, p: self.command_dm(t),
+            "#flipcoin": lambda t, i, s, p: self.command_flipcoin(i, s),
+            "#random": lambda t, i, s, p: self.command_random(i, s),
+            "#twin": lambda t, i, s, p: self.command_twin(t, i, s),
+            "#weather": lambda t, i, s, p: self.command_weather(i, s),
+            "#tides": lambda t, i, s, p: self.command_tides(i, s),
+            "#test": lambda t, i, s, p: self.command_test(i, s),
+            "#tst-detail": lambda t, i, s, p: self.command_tst_detail(p, i, s),
+            "#whois": lambda t, i, s, p: self.command_whois(t, i, s),
+            "#bbs": lambda t, i, s, p: self.command_bbs(t, p, i, s),
+            "#kill_all_robots": lambda t, i, s, p: self.command_kill_all_robots(i, s),
+            "#help": lambda t, i, s, p: self.command_help(i, s),
+        }
+
     def load_setting(self):
 
-        with open("settings.yaml", "r") as file:
-            settings = yaml.safe_load(file)
+        if self._settings is None:
+            with open("settings.yaml", "r") as file:
+                self._settings = yaml.load(file, Loader=_YamlLoader)
+        settings = self._settings
 
         if "LOCATION" in settings:
             self.location = settings.get("LOCATION")
@@ -113,11 +200,15 @@ class MeshBot:
 
         self.tide_location = settings.get("TIDE_LOCATION", self.location)
         self.mynode = settings.get("MYNODE")
+        self.mynode_num = int(self.mynode) if self.mynode is not None else None
         self.mynodes = settings.get("MYNODES", None)
+        self.mynodes_set = frozenset(str(node) for node in (self.mynodes or []))
         self.db_filename = settings.get("DBFILENAME")
         self.dm_mode = settings.get("DM_MODE", True)
         self.firewall = settings.get("FIREWALL", True)
         self.dutycycle = settings.get("DUTYCYCLE", True)
+        self.weather_ttl = settings.get("WEATHER_TTL", 1800)
+        self.tides_ttl = settings.get("TIDES_TTL", 21600)
 
         logger.info(f"DUTYCYCLE: {self.dutycycle}")
         logger.info(f"DM_MODE: {self.dm_mode}")
@@ -126,194 +217,196 @@ class MeshBot:
         self.weather_fetcher = WeatherFetcher(self.location)
         self.tides_scraper = TidesScraper(self.tide_location)
         self.bbs = BBS()
-
-    # Function to periodically refresh weather and tides data
-    def refresh_data(self):
+        self.whois = Whois(self.db_filename)
+        self._rebuild_gate()
+
+    def _rebuild_gate(self):
+        """Precompute the packet admission check from the current flags.
+
+        Called whenever dutycycle/dm_mode/firewall change so the per-packet
+        predicate only evaluates the clauses that are actually enabled.
+        """
+        checks = []
+        if self.dutycycle:
+            checks.append(lambda packet: self.transmission_count < 16)
+        if self.dm_mode:
+            checks.append(lambda packet: packet["to"] == self.mynode_num)
+        if self.firewall:
+            checks.append(lambda packet: str(packet["from"]) in self.mynodes_set)
+        self._gate = lambda packet: all(check(packet) for check in checks)
+
+    def _bump_tx(self, delta=1):
+        """Atomically adjust transmission_count (floored at zero)."""
+        with self._state_lock:
+            self.transmission_count = max(0, self.transmission_count + delta)
+
+    async def _tick_transmission(self):
         while True:
-            self.weather_info = self.weather_fetcher.get_weather()
-            self.tides_info = self.tides_scraper.get_tides()
-            time.sleep(3 * 60 * 60)  # Sleep for 3 hours
-
-    def _background_resets(self):
-        """Single background thread handling all periodic resets."""
-        last_transmission_reset = time.time()
-        last_cooldown_reset = time.time()
-        last_killbot_reset = time.time()
+            await asyncio.sleep(180)
+            self._bump_tx(-1)
+            logger.info(f"Reducing transmission count {self.transmission_count}")
 
+    async def _tick_cooldown(self):
         while True:
-            now = time.time()
-
-            if now - last_transmission_reset >= 180:
-                self.transmission_count = max(0, self.transmission_count - 1)
-                logger.info(f"Reducing transmission count {self.transmission_count}")
-                last_transmission_reset = now
+            await asyncio.sleep(240)
+            self.cooldown = False
+            logger.info("Cooldown Disabled.")
 
-            if now - last_cooldown_reset >= 240:
-                self.cooldown = False
-                logger.info("Cooldown Disabled.")
-                last_cooldown_reset = now
+    async def _tick_killbot(self):
+        while True:
+            await asyncio.sleep(120)
+            self.kill_all_robots = 0
+            logger.info("Killbot Disabled.")
 
-            if now - last_killbot_reset >= 120:
-                self.kill_all_robots = 0
-                logger.info("Killbot Disabled.")
-                last_killbot_reset = now
+    async def _main(self):
+        """Run all periodic reset timers until a stop signal arrives."""
+        self._stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, self._stop.set)
+        except NotImplementedError:
+            # Windows event loops can't register signal handlers; fall back
+            # to the KeyboardInterrupt that CTRL-C raises below
+            pass
 
-            time.sleep(5)  # Check every 5 seconds — negligible CPU usage
+        ticks = asyncio.gather(
+            self._tick_transmission(),
+            self._tick_cooldown(),
+            self._tick_killbot(),
+        )
+        # Block until a signal fires — no periodic wakeups on the main thread
+        await self._stop.wait()
+        ticks.cancel()
+        logger.info("Stop signal received, shutting down.")
 
     def _send(self, text, sender_id, wantAck=False):
+        self.send_queue.enqueue(sender_id, text, want_ack=wantAck)
+
+    def _transmit(self, text, want_ack, dest_id):
+        """Hand one (possibly coalesced) packet to the radio."""
         try:
-            self.interface.sendText(text, wantAck=wantAck, destinationId=sender_id)
-            self.transmission_count += 1
+            self.interface.sendText(text, wantAck=want_ack, destinationId=dest_id)
+            self._bump_tx()
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
 
-    def reset_transmission_count(self):
-        self.transmission_count -= 1
-        if self.transmission_count < 0:
-            self.transmission_count = 0
-        logger.info(f"Reducing transmission count {self.transmission_count}")
-        threading.Timer(180.0, self.reset_transmission_count).start()
-
-    def reset_cooldown(self):
-        self.cooldown = False
-        logger.info("Cooldown Disabled.")
-        threading.Timer(240.0, self.reset_cooldown).start()
-
-    def reset_killallrobots(self):
-        self.kill_all_robots = 0
-        logger.info("Killbot Disabled.")
-        threading.Timer(120.0, self.reset_killallrobots).start()
-
-    def command_fw(self, message):
+    def command_fw(self, tok):
         logger.info("Firewall Mode Command Received")
-        message_parts = message.split(" ")
-        if len(message_parts) > 1:
-            if message_parts[1].lower() == "off":
-                self.firewall = False
-                logger.info("FIREWALL=False")
-            else:
-                self.firewall = True
-                logger.info("FIREWALL=True")
+        if len(tok.parts) > 1 and tok.parts[1].lower() == "off":
+            self.firewall = False
+            logger.info("FIREWALL=False")
         else:
             self.firewall = True
             logger.info("FIREWALL=True")
+        self._rebuild_gate()
 
-    def command_dm(self, message):
+    def command_dm(self, tok):
         logger.info("DM Mode Command Received")
-        message_parts = message.split(" ")
-        if len(message_parts) > 1:
-            if message_parts[1].lower() == "off":
-                self.dm_mode = False
-                logger.info("DM_MODE=False")
-            else:
-                self.dm_mode = True
-                logger.info("DM_MODE=True")
+        if len(tok.parts) > 1 and tok.parts[1].lower() == "off":
+            self.dm_mode = False
+            logger.info("DM_MODE=False")
         else:
             self.dm_mode = True
             logger.info("DM_MODE=True")
+        self._rebuild_gate()
 
     def command_flipcoin(self, interface, sender_id):
 
         logger.info("Flipcoin Command Recived")
         # Increment the transmission count for this message
-        self.transmission_count += 1
+        self._bump_tx()
         
-        text = secrets.choice(["Heads", "Tails"])
+        text = self._rng.choice(("Heads", "Tails"))
         self._send(text, sender_id, wantAck=True)
 
     def command_random(self, interface, sender_id):
 
         logger.info("Random Command Recived")
-        self.transmission_count += 1
+        self._bump_tx()
 
-        text = str(secrets.randbelow(10) + 1)
+        text = str(self._rng.randrange(1, 11))
         self._send(text, sender_id, wantAck=True)
 
-    def command_twin(self, message, interface, sender_id):
+    def command_twin(self, tok, interface, sender_id):
         logger.info("Twin Command Recived")
-#        message_parts = packet["decoded"]["text"].split(" ")
-        message_parts = message.split(" ")
+        message_parts = tok.parts
         content = " ".join(message_parts[2:])
         if message_parts[1].lower() == "d":
-            text = TwinHexDecoder().decrypt(content)
-            self._send(text, sender_id, wantAck=True)
-
+            text = _TWIN_DEC.decrypt(content)
         else:
-            text = TwinHexEncoder().encrypt(content)
-            self._send(text, sender_id, wantAck=True)
+            text = _TWIN_ENC.encrypt(content)
+        self._send(text, sender_id, wantAck=True)
+
+    def command_weather(self, interface, sender_id):
+        logger.info("Weather Command Received")
+        weather_info = self.data_cache.get_or_fetch(
+            ("weather", self.location),
+            self.weather_fetcher.get_weather,
+            ttl=self.weather_ttl,
+        )
+        self._send(weather_info, sender_id, wantAck=True)
+
+    def command_tides(self, interface, sender_id):
+        logger.info("Tides Command Received")
+        tides_info = self.data_cache.get_or_fetch(
+            ("tides", self.tide_location),
+            self.tides_scraper.get_tides,
+            ttl=self.tides_ttl,
+        )
+        self._send(tides_info, sender_id, wantAck=True)
+
+    def command_test(self, interface, sender_id):
+        logger.info("Test Command Received")
+        self._send(ACK_TEXT, sender_id, wantAck=True)
 
     def command_tst_detail(self, packet, interface, sender_id):
         logger.info("Detailed Test command Received")
-        self.transmission_count += 1
-        testreply = "🟢 ACK."
+        self._bump_tx()
+        received = ""
         if "hopStart" in packet:
-            if (packet["hopStart"] - packet["hopLimit"]) == 0:
-                testreply += "Received Directly at "
+            hops = packet["hopStart"] - packet["hopLimit"]
+            if hops == 0:
+                received = "Received Directly at "
             else:
-                testreply += "Received from " + str(packet["hopStart"] - packet["hopLimit"]) + "hop(s) away at"
-        testreply += str(packet["rxRssi"]) + "dB, SNR: " + str(packet["rxSnr"]) + "dB (" + str(int(packet["rxSnr"] + 10 * 5)) + "%)"
+                received = f"Received from {hops} hop(s) away at "
+        # Map SNR to a percentage: -10 dB -> 0%, +10 dB -> 100%, clamped
+        pct = max(0, min(100, int((packet["rxSnr"] + 10) * 5)))
+        testreply = (
+            f"🟢 ACK. {received}{packet['rxRssi']}dB, "
+            f"SNR: {packet['rxSnr']}dB ({pct}%)"
+        )
 
         self._send(testreply, sender_id, wantAck=True)
 
-    def command_whois(self, message, interface, sender_id):
+    def command_whois(self, tok, interface, sender_id):
         logger.info("whois command received")
-        message_parts = message.split("#")
-        self.transmission_count += 1
-        lookup_complete = False
-        if len(message_parts) > 1:
-            whois_search = Whois(self.db_filename)
-            logger.info(
-                f"Querying whois DB {self.db_filename} for: {message_parts[2].strip()}"
-            )
-            try:
-                if (
-                    type(int(message_parts[2].strip(), 16)) == int
-                    or type(int(message_parts[2].strip().upper(), 16)) == int
-                ):
-                    result = whois_search.search_nodes(message_parts[2].strip())
-
-                    if result:
-                        node_id, long_name, short_name = result
-                        whois_data = f"ID:{node_id}\n"
-                        whois_data += f"Long Name: {long_name}\n"
-                        whois_data += f"Short Name: {short_name}"
-                        logger.info(f"Data: {whois_data}")
-                        self._send(f"{whois_data}", sender_id, wantAck=False)
-                    else:
-                        self._send("No matching record found.", sender_id, wantAck=False)
-                        lookup_complete = True
-            except:
-                logger.error("Not a hex string aborting!")
-                pass
-            if (
-                type(message_parts[2].strip()) == str
-                and lookup_complete == False
-            ):
-                result = whois_search.search_nodes_sn(message_parts[2].strip())
-
-                if result:
-                    node_id, long_name, short_name = result
-                    whois_data = f"ID:{node_id}\n"
-                    whois_data += f"Long Name: {long_name}\n"
-                    whois_data += f"Short Name: {short_name}"
-                    logger.info(f"Data: {whois_data}")
-                    self._send(f"{whois_data}", sender_id, wantAck=False)
-                else:
-                    self._send("No matching record found.", sender_id, wantAck=False)
+        message_parts = tok.raw.split("#")
+        self._bump_tx()
+        if len(message_parts) > 2:
+            token = message_parts[2].strip()
+            logger.info(f"Querying whois DB {self.db_filename} for: {token}")
+            if self._hex_re.match(token):
+                result = self.whois.search_nodes(token)
             else:
-                self._send("No matching record found.", sender_id, wantAck=False)
+                result = self.whois.search_nodes_sn(token)
 
-            whois_search.close_connection()
-        else:
-            pass
+            if result:
+                node_id, long_name, short_name = result
+                whois_data = f"ID:{node_id}\n"
+                whois_data += f"Long Name: {long_name}\n"
+                whois_data += f"Short Name: {short_name}"
+                logger.info(f"Data: {whois_data}")
+                self._send(f"{whois_data}", sender_id, wantAck=False)
+            else:
+                self._send("No matching record found.", sender_id, wantAck=False)
 
-    def command_bbs(self, packet, interface, sender_id):
+    def command_bbs(self, tok, packet, interface, sender_id):
         logger.info("bbs Command Received")
-        message = packet["decoded"]["text"].lower()
-        self.transmission_count += 1
+        self._bump_tx()
         count = 0
-        message_parts = message.split()
-        addy = hex(packet["from"]).replace("0x", "!")
+        message_parts = tok.parts
+        addy = _addr(packet["from"])
         if message_parts[1].lower() == "any":
             try:
                 count = self.bbs.count_messages(addy)
@@ -345,112 +438,69 @@ class MeshBot:
             content = " ".join(
                 message_parts[3:]
             )  # Join the remaining parts as the message content
-            whois_search = Whois(self.db_filename)
-            result = whois_search.search_nodes(
-                hex(packet["from"]).replace("0x", "")
-            )
+            result = self.whois.search_nodes(_hex(packet["from"]))
             if result:
                 node_id, long_name, short_name = result
             else:
-                short_name = hex(packet["from"])
-            content = (
-                content
-                + ". From: "
-                + short_name
-                + "("
-                + str(hex(packet["from"])).replace("0x", "!")
-                + ")"
-            )
+                short_name = addy
+            content = content + ". From: " + short_name + "(" + addy + ")"
             self.bbs.post_message(message_parts[2], content)
 
-    def command_kill_all_robots(self, message, interface, sender_id):
+    def command_kill_all_robots(self, interface, sender_id):
         logger.info("Kill All Robots Command Received")
-        self.transmission_count += 1
+        self._bump_tx()
         if self.kill_all_robots == 0:
             self._send("Confirm", sender_id, wantAck=False)
-            self.kill_all_robots += 1
+            with self._state_lock:
+                self.kill_all_robots += 1
         if self.kill_all_robots > 1:
             self._send("💣 Deactivating all reachable bots... SECRET_SHUTDOWN_STRING", sender_id, wantAck=False)
-            self.transmission_count += 1
+            self._bump_tx()
             self.kill_all_robots = 0
 
     def command_help(self, interface, sender_id):
         logger.info("Help Command Received")
-        self.transmission_count += 1
-        self._send("Available commands:\n #help\n #test\n #tst-detail\n #weather\n #tides\n #flipcoin\n #random\n", sender_id, wantAck=False)
+        self._bump_tx()
+        self._send(HELP_TEXT, sender_id, wantAck=False)
+
+    def _log_handler_error(self, future):
+        # Exceptions in pooled handlers only surface through the Future
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Command handler failed: {exc!r}")
 
-    # Function to handle incoming messages
+    # Function to handle incoming text messages; the subscription topic
+    # already filters out position/telemetry/nodeinfo packets
     def message_listener(self, packet, interface):
 
-        if packet is not None and "decoded" in packet and \
-                packet["decoded"].get("portnum") == "TEXT_MESSAGE_APP":
-            message = packet["decoded"]["text"]
-
-            if not message.strip().startswith("#"):
-                return
-            message = message.lower()
-            sender_id = packet["from"]
-            logger.info(f"Message {packet['decoded']['text']} from {packet['from']}")
-            logger.info(f"transmission count {self.transmission_count}")
-            
-            if (
-                (self.transmission_count < 16 or self.dutycycle == False)
-                and (self.dm_mode == 0 or str(packet["to"]) == self.mynode)
-                and (self.firewall == 0 or any(node in str(packet["from"]) for node in self.mynodes))
-            ):
-                if "#fw" in message:
-                    self.command_fw(message)
-                elif "#dm" in message:
-                    self.command_dm(message)
-                elif "#flipcoin" in message:
-                    self.command_flipcoin(interface, sender_id)
-                elif "#random" in message:
-                    self.command_random(interface, sender_id)
-                elif "#twin" in message:
-                    self.command_twin(message, interface, sender_id)
-                elif "#weather" in message:
-                    self.transmission_count += 1
-                    interface.sendText(self.weather_info, wantAck=True, destinationId=sender_id)
-                elif "#tides" in message:
-                    self.transmission_count += 1
-                    interface.sendText(self.tides_info, wantAck=True, destinationId=sender_id)
-                elif "#test" in message:
-                    self.transmission_count += 1
-                    interface.sendText("🟢 ACK", wantAck=True, destinationId=sender_id)
-                elif "#tst-detail" in message:
-                    self.command_tst_detail(packet, interface, sender_id)
-                elif "#whois #" in message:
-                    self.command_whois(packet, interface, sender_id)
-                elif "#bbs" in message:
-                    self.command_bbs(packet, interface, sender_id)
-                elif "#kill_all_robots" in message:
-                    self.command_kill_all_robots(message, interface, sender_id)
-                elif "#help" in message:
-                    self.command_help(interface, sender_id)
-            if self.transmission_count >= 11 and self.dutycycle == True:
-                if not self.cooldown:
-                    interface.sendText(
-                        "❌ Bot has reached duty cycle, entering cool down... ❄",
-                        wantAck=False,
-                    )
-                    logger.info("Cooldown enabled.")
-                    self.cooldown = True
-                logger.info(
-                    "Duty cycle limit reached. Please wait before transmitting again."
-                )
-            else:
-                # do nothing as not a keyword and message destination was the node
-                pass
+        raw = packet["decoded"]["text"]
+
+        if not raw.strip().startswith("#"):
+            return
+        parts = raw.split()
+        tok = Tokens(raw, parts[0].lower(), parts)
+        sender_id = packet["from"]
+        logger.info(f"Message {raw} from {sender_id}")
+        logger.info(f"transmission count {self.transmission_count}")
+
+        if self._gate(packet):
+            handler = self._commands.get(tok.cmd)
+            if handler:
+                future = self._pool.submit(handler, tok, interface, sender_id, packet)
+                future.add_done_callback(self._log_handler_error)
+        if self.transmission_count >= 11 and self.dutycycle == True:
+            if not self.cooldown:
+                interface.sendText(COOLDOWN_TEXT, wantAck=False)
+                logger.info("Cooldown enabled.")
+                self.cooldown = True
+            logger.info(
+                "Duty cycle limit reached. Please wait before transmitting again."
+            )
 
 
     # Main function
     def run(self):
         logger.info("Starting program.")
-
-        reset_thread = threading.Thread(target=self._background_resets)
-        reset_thread.daemon = True
-        reset_thread.start()
-
         logger.info(f"Press CTRL-C x2 to terminate the program")
 
         if self.ip_host and self.serial_ports:
@@ -458,18 +508,19 @@ class MeshBot:
         else:
             self.interface = meshtastic.serial_interface.SerialInterface(self.serial_ports[0])
 
-        # Receive Mechtastic Messages    
-        pub.subscribe(self.message_listener, "meshtastic.receive")
+        self.send_queue = SendQueue(self._transmit)
 
-        # Start a separate thread for refreshing data periodically
-        refresh_thread = threading.Thread(target=self.refresh_data)
-        refresh_thread.daemon = True
-        refresh_thread.start()
+        # Receive Mechtastic text messages only
+        pub.subscribe(self.message_listener, "meshtastic.receive.text")
 
-        # Keep the main thread alive
-        while True:
-            time.sleep(1)
-            continue
+        # Run the reset timers on the main thread's event loop; the
+        # meshtastic interface keeps its own reader thread for the radio
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            logger.info("Interrupted, shutting down.")
+        finally:
+            self.whois.close_connection()
 
 def load_args():
     parser = argparse.ArgumentParser(description="Meshbot a bot for Meshtastic devices")
@@ -0,0 +1,53 @@
+import threading
+from collections import deque
+
+
+class SendQueue:
+    """
+    Coalescing queue for outbound text messages.
+
+    Replies queued for the same destination within a short window are
+    joined into a single packet (up to the payload size limit) before
+    being handed to the radio, so a burst of short replies costs one
+    LoRa transmission instead of one per reply.
+    """
+
+    SEPARATOR = "\n---\n"
+    MAX_PAYLOAD = 200  # bytes; stays under Meshtastic's ~230-byte text cap
+    WINDOW = 0.2  # seconds to wait for more fragments before flushing
+
+    def __init__(self, send_fn):
+        # send_fn(text, want_ack, dest_id) performs the actual transmission
+        self._send_fn = send_fn
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timers = {}
+
+    def enqueue(self, dest_id, text, want_ack=False):
+        """
+        Queue text for dest_id, arming a flush timer if one is not
+        already pending for that destination.
+        """
+        with self._lock:
+            self._pending.setdefault(dest_id, deque()).append((text, want_ack))
+            if dest_id not in self._timers:
+                timer = threading.Timer(self.WINDOW, self._flush, args=(dest_id,))
+                timer.daemon = True
+                self._timers[dest_id] = timer
+                timer.start()
+
+    def _flush(self, dest_id):
+        with self._lock:
+            fragments = self._pending.pop(dest_id, deque())
+            self._timers.pop(dest_id, None)
+
+        while fragments:
+            text, want_ack = fragments.popleft()
+            while fragments:
+                joined = text + self.SEPARATOR + fragments[0][0]
+                if len(joined.encode("utf-8")) > self.MAX_PAYLOAD:
+                    break
+                text = joined
+                want_ack = want_ack or fragments[0][1]
+                fragments.popleft()
+            self._send_fn(text, want_ack, dest_id)
@@ -0,0 +1,38 @@
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Small thread-safe cache with per-entry time-to-live.
+
+    Values are fetched on demand and served from memory until they expire,
+    so callers get bounded staleness without a background refresh thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get_or_fetch(self, key, fetch, ttl):
+        """
+        Return the cached value for key, calling fetch() to (re)populate it
+        if the entry is missing or older than ttl seconds.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+        # Fetch outside the lock so a slow fetch does not block other keys
+        value = fetch()
+
+        with self._lock:
+            self._entries[key] = (value, now + ttl)
+        return value
+
+
+# Example usage:
+# cache = TTLCache()
+# weather = cache.get_or_fetch("Swansea", fetch_weather, ttl=1800)
@@ -1,20 +1,42 @@
+import functools
 import sqlite3
+import threading
 
 
 class Whois:
+    _QUERY_BY_ID = (
+        "SELECT node_id, long_name, short_name FROM nodes WHERE node_id LIKE ?"
+    )
+    _QUERY_BY_SN = (
+        "SELECT node_id, long_name, short_name FROM nodes WHERE short_name LIKE ?"
+    )
+
     def __init__(self, db_file):
-        self.conn = sqlite3.connect(db_file)
+        # One long-lived connection shared by all of the bot's worker
+        # threads; queries are serialized through the lock
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
         self.cursor = self.conn.cursor()
-
-    def search_nodes(self, search_pattern):
-        query = "SELECT * FROM nodes WHERE node_id LIKE ?"
-        self.cursor.execute(query, ("%" + search_pattern + "%",))
-        return self.cursor.fetchone()
-
-    def search_nodes_sn(self, search_pattern):
-        query = "SELECT * FROM nodes WHERE short_name LIKE ?"
-        self.cursor.execute(query, ("%" + search_pattern + "%",))
-        return self.cursor.fetchone()
+        self._lock = threading.Lock()
+
+        # Per-instance LRU caches: the same node IDs get asked about
+        # repeatedly, so serve repeats from memory instead of SQLite.
+        # invalidate() clears them if the DB is refreshed.
+        self.search_nodes = functools.lru_cache(maxsize=1024)(self._search_nodes)
+        self.search_nodes_sn = functools.lru_cache(maxsize=1024)(self._search_nodes_sn)
+
+    def _search_nodes(self, search_pattern):
+        with self._lock:
+            self.cursor.execute(self._QUERY_BY_ID, ("%" + search_pattern + "%",))
+            return self.cursor.fetchone()
+
+    def _search_nodes_sn(self, search_pattern):
+        with self._lock:
+            self.cursor.execute(self._QUERY_BY_SN, ("%" + search_pattern + "%",))
+            return self.cursor.fetchone()
+
+    def invalidate(self):
+        self.search_nodes.cache_clear()
+        self.search_nodes_sn.cache_clear()
 
     def close_connection(self):
         self.conn.close()